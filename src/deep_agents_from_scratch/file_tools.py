@@ -4,6 +4,10 @@ This module provides tools for managing a virtual filesystem stored in agent sta
 enabling context offloading and information persistence across agent interactions.
 """
 
+import base64
+import zlib
+from collections.abc import Iterator
+from itertools import islice
 from typing import Annotated
 
 from langchain_core.messages import ToolMessage
@@ -18,6 +22,55 @@ from deep_agents_from_scratch.prompts import (
 )
 from deep_agents_from_scratch.state import DeepAgentState
 
+# 압축 저장된 파일 콘텐츠를 식별하기 위한 접두사
+COMPRESSED_PREFIX = "ZLIB:"
+
+# 이 크기를 넘는 콘텐츠만 압축 대상 (짧은 파일은 압축 이득이 없음)
+COMPRESS_THRESHOLD = 16 * 1024
+
+
+def maybe_compress_content(content: str) -> str:
+    """Compress large file content for storage in agent state.
+
+    검색 결과의 raw content처럼 수십 KB에 달하는 파일이 state에 쌓이면
+    모든 reducer 병합과 체크포인트가 해당 바이트를 그대로 운반하게 됩니다.
+    임계치를 넘는 콘텐츠는 zlib+base64로 압축 저장하여 state 크기를 줄입니다.
+
+    Args:
+        content: File content to store
+
+    Returns:
+        Prefixed compressed representation, or the original content when it
+        is below the threshold or compression does not actually shrink it
+    """
+    if len(content) < COMPRESS_THRESHOLD:
+        return content
+    packed = base64.b64encode(zlib.compress(content.encode(), 6)).decode("ascii")
+    # base64 오버헤드로 인해 오히려 커지는 경우 원본 유지
+    if len(COMPRESSED_PREFIX) + len(packed) >= len(content):
+        return content
+    return COMPRESSED_PREFIX + packed
+
+
+def decompress_content(content: str) -> str:
+    """Restore file content that may have been compressed for state storage.
+
+    Args:
+        content: Stored file content, possibly produced by maybe_compress_content
+
+    Returns:
+        Original uncompressed content
+    """
+    if not content.startswith(COMPRESSED_PREFIX):
+        return content
+    packed = content[len(COMPRESSED_PREFIX) :]
+    try:
+        return zlib.decompress(base64.b64decode(packed)).decode()
+    except (ValueError, zlib.error):
+        # 우연히 접두사로 시작하는 비압축 콘텐츠(임계치 미만으로 원본 저장)는
+        # 그대로 반환
+        return content
+
 
 @tool(description=LS_DESCRIPTION)
 def ls(state: Annotated[DeepAgentState, InjectedState]) -> list[str]:
@@ -25,6 +78,51 @@ def ls(state: Annotated[DeepAgentState, InjectedState]) -> list[str]:
     return list(state.get("files", {}).keys())
 
 
+def _detect_newline(content: str) -> str:
+    r"""Detect a file's line-ending convention from its first line break.
+
+    문자 단위 파이썬 루프 대신 C 레벨 str.find 한 번으로 판별합니다.
+
+    Args:
+        content: File content to inspect
+
+    Returns:
+        "\\r\\n" or "\\n" depending on the first line break, or "" if the
+        content is a single line
+    """
+    i = content.find("\n")
+    if i < 0:
+        return ""
+    if i > 0 and content[i - 1] == "\r":
+        return "\r\n"
+    return "\n"
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield lines from a string lazily without materializing a full list.
+
+    splitlines()는 파일 전체를 리스트로 복사하므로, 일부 구간만 필요한 경우
+    str.find로 줄 경계를 순차 탐색하며 필요한 줄만 생성합니다.
+
+    Args:
+        content: Full file content to iterate over
+
+    Yields:
+        Lines of the content without trailing newline characters
+    """
+    pos = 0
+    n = len(content)
+    while pos < n:
+        nl = content.find("\n", pos)
+        end = n if nl < 0 else nl
+        # splitlines와 동일하게 CRLF의 '\r'도 제거 (LF/CRLF 혼합 파일 포함)
+        line = content[pos:end]
+        if line.endswith("\r"):
+            line = line[:-1]
+        yield line
+        pos = end + 1
+
+
 @tool(description=READ_FILE_DESCRIPTION, parse_docstring=True)
 def read_file(
     file_path: str,
@@ -47,23 +145,26 @@ def read_file(
     if file_path not in files:
         return f"Error: File '{file_path}' not found"
 
-    content = files[file_path]
+    # 압축 저장된 콘텐츠는 읽기 시점에 복원
+    content = decompress_content(files[file_path])
     if not content:
         return "System reminder: File exists but has empty contents"
 
-    lines = content.splitlines()
-    start_idx = offset
-    end_idx = min(start_idx + limit, len(lines))
+    # 요청된 구간만 지연 순회로 추출, offset 이전 줄은 할당 없이 건너뜀
+    window = islice(_iter_lines(content), offset, offset + limit)
 
-    if start_idx >= len(lines):
-        return f"Error: Line offset {offset} exceeds file length ({len(lines)} lines)"
+    # 중간 리스트 없이 str.join이 제너레이터를 직접 소비 (긴 줄은 2000자로 절단)
+    formatted = "\n".join(
+        f"{i:6d}\t{line[:2000]}" for i, line in enumerate(window, start=offset + 1)
+    )
 
-    result_lines = []
-    for i in range(start_idx, end_idx):
-        line_content = lines[i][:2000]  # Truncate long lines
-        result_lines.append(f"{i + 1:6d}\t{line_content}")
+    if not formatted:
+        # offset이 파일 범위를 벗어난 경우에만 전체 줄 수 계산 (C 레벨 count 사용)
+        # 줄바꿈으로 끝나는 파일은 마지막 '\n' 뒤에 줄이 없으므로 +1 보정 제외
+        total_lines = content.count("\n") + (0 if content.endswith("\n") else 1)
+        return f"Error: Line offset {offset} exceeds file length ({total_lines} lines)"
 
-    return "\n".join(result_lines)
+    return formatted
 
 
 @tool(description=WRITE_FILE_DESCRIPTION, parse_docstring=True)
@@ -84,11 +185,11 @@ def write_file(
     Returns:
         Command to update agent state with new file content
     """
-    files = state.get("files", {})
-    files[file_path] = content
+    # 변경된 파일 하나만 델타로 반환, 전체 병합은 file_reducer가 O(1)로 수행
+    # (대용량 콘텐츠는 압축 저장하여 state 병합/체크포인트 비용 절감)
     return Command(
         update={
-            "files": files,
+            "files": {file_path: maybe_compress_content(content)},
             "messages": [
                 ToolMessage(f"Updated file {file_path}", tool_call_id=tool_call_id)
             ],
@@ -106,6 +106,34 @@ Output format:
 Today's date: {date}
 """
 
+SUMMARIZE_WEB_SEARCH_BATCH = """You are creating minimal summaries for research steering - your goal is to help an agent know what information it has collected, NOT to preserve all details.
+
+Below are {num_documents} webpage documents, each delimited by a numbered header.
+
+{webpage_contents}
+
+For EACH document, create a VERY CONCISE summary focusing on:
+1. Main topic/subject in 1-2 sentences
+2. Key information type (facts, tutorial, news, analysis, etc.)
+3. Most significant 1-2 findings or points
+
+Keep each summary under 150 words. The agent needs to know what's in each file to decide if it should search for more information or use this source.
+
+Generate a descriptive filename per document that indicates the content type and topic (e.g., "mcp_protocol_overview.md", "ai_safety_research_2024.md").
+
+Output format - a JSON array with exactly {num_documents} objects, in document order:
+```json
+[
+   {{
+      "filename": "descriptive_filename.md",
+      "summary": "Very brief summary under 150 words focusing on main topic and key findings"
+   }}
+]
+```
+
+Today's date: {date}
+"""
+
 RESEARCHER_INSTRUCTIONS = """You are a research assistant conducting research on the user's input topic. For context, today's date is {date}.
 
 <Task>
@@ -4,18 +4,29 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import asyncio
+import json
+import time
+from collections import OrderedDict
 from datetime import datetime
+from hashlib import blake2b
+from threading import Lock
 
+from anthropic import Anthropic
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, ToolMessage
 from langchain_core.tools import InjectedToolArg, InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 from pydantic import BaseModel, Field
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient, TavilyClient
 from typing_extensions import Annotated, Literal
 
-from deep_agents_from_scratch.prompts import SUMMARIZE_WEB_SEARCH
+from deep_agents_from_scratch.file_tools import maybe_compress_content
+from deep_agents_from_scratch.prompts import (
+    SUMMARIZE_WEB_SEARCH,
+    SUMMARIZE_WEB_SEARCH_BATCH,
+)
 from deep_agents_from_scratch.state import DeepAgentState
 
 
@@ -26,6 +37,48 @@ def get_current_time() -> str:
 
 tavily_client = TavilyClient()
 
+# 논블로킹 검색을 위한 비동기 Tavily 클라이언트
+async_tavily_client = AsyncTavilyClient()
+
+# 동일 쿼리 반복 검색시 HTTP 왕복을 제거하기 위한 프로세스 로컬 LRU 캐시
+# (서브 에이전트 재시도나 토픽이 겹치는 탐색에서 동일 쿼리가 자주 발생)
+SEARCH_CACHE_MAX = 256
+_search_cache: OrderedDict[tuple, str] = OrderedDict()
+_search_cache_lock = Lock()
+
+
+def _search_cache_get(key: tuple) -> dict | None:
+    """Look up a cached search response and refresh its LRU position.
+
+    Args:
+        key: Cache key of (query, max_results, topic, include_raw_content)
+
+    Returns:
+        Deserialized search results dictionary, or None on cache miss
+    """
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached is None:
+            return None
+        _search_cache.move_to_end(key)
+    # JSON으로 동결된 응답을 역직렬화하여 호출자별 독립 사본 반환
+    return json.loads(cached)
+
+
+def _search_cache_put(key: tuple, result: dict) -> None:
+    """Store a search response in the LRU cache, evicting the oldest entry.
+
+    Args:
+        key: Cache key of (query, max_results, topic, include_raw_content)
+        result: Search results dictionary to freeze and cache
+    """
+    frozen = json.dumps(result)
+    with _search_cache_lock:
+        _search_cache[key] = frozen
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+
 
 def run_web_search(
     search_query: str,
@@ -44,18 +97,115 @@ def run_web_search(
     Returns:
         Search results dictionary
     """
+    # 캐시 히트시 HTTP 왕복 없이 즉시 반환
+    key = (search_query, max_results, topic, include_raw_content)
+    cached = _search_cache_get(key)
+    if cached is not None:
+        return cached
+
     result = tavily_client.search(
         search_query,
         max_results=max_results,
         include_raw_content=include_raw_content,
         topic=topic,
     )
+    _search_cache_put(key, result)
+    return result
+
+
+async def arun_web_search(
+    search_query: str,
+    max_results: int = 2,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+) -> dict:
+    """Perform search using the Tavily API asynchronously for a single query.
+
+    이벤트 루프를 블로킹하지 않는 비동기 검색. 여러 쿼리를 동시에 실행할
+    경우 asyncio.gather로 묶어 전체 지연 시간을 단일 요청 수준으로 단축합니다.
+
+    Args:
+        search_query: Search query to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+
+    Returns:
+        Search results dictionary
+    """
+    # 캐시 히트시 HTTP 왕복 없이 즉시 반환
+    key = (search_query, max_results, topic, include_raw_content)
+    cached = _search_cache_get(key)
+    if cached is not None:
+        return cached
+
+    result = await async_tavily_client.search(
+        search_query,
+        max_results=max_results,
+        include_raw_content=include_raw_content,
+        topic=topic,
+    )
+    _search_cache_put(key, result)
     return result
 
 
 # 요약을 위한 LLM 초기화
+SUMMARIZATION_MODEL_NAME = "claude-haiku-4-5"
 summarization_model = init_chat_model(
-    model="anthropic:claude-haiku-4-5", temperature=0.0
+    model=f"anthropic:{SUMMARIZATION_MODEL_NAME}", temperature=0.0
+)
+
+# Message Batches API 호출을 위한 Anthropic SDK 클라이언트
+anthropic_client = Anthropic()
+
+# Batch 작업 완료 여부 폴링 간격 (초)
+BATCH_POLL_INTERVAL = 2.0
+
+# Batch 작업 폴링 마감 시간 (초) - 초과시 작업을 취소하고 실시간 경로로 폴백
+# (Message Batches는 최대 24시간까지 걸릴 수 있으므로 상한이 반드시 필요)
+BATCH_POLL_TIMEOUT = 600.0
+
+# 마샬링 프롬프트의 문서 1건당 출력 토큰 예산 (150단어 요약 + 파일명 + JSON 구조)
+MAX_TOKENS_PER_DOCUMENT = 1024
+
+# 하나의 요약 프롬프트에 함께 담을 웹페이지 수 (row-marshaling 배치 크기)
+ROW_MARSHAL_BATCH = 4
+
+# 요약 입력으로 사용할 콘텐츠 최대 길이 - 초과분은 head+tail만 유지
+# (보일러플레이트가 많은 긴 페이지의 중간부는 요약 품질에 거의 기여하지 않음)
+MAX_SUMMARY_INPUT = 50 * 1024
+
+
+def _compile_template(template: str, fields: list[str]) -> list[str]:
+    """Split a str.format template into literal parts around its placeholders.
+
+    str.format은 호출마다 템플릿 전체를 다시 파싱하므로, 자리 표시자 기준으로
+    한 번만 분해해 두면 행당 렌더링이 순수 문자열 연결로 줄어듭니다.
+
+    Args:
+        template: Format string to pre-compile
+        fields: Placeholder names in their order of appearance
+
+    Returns:
+        len(fields) + 1 literal parts with brace escapes resolved
+    """
+    parts = []
+    rest = template
+    for field in fields:
+        before, rest = rest.split("{" + field + "}", 1)
+        parts.append(before)
+    parts.append(rest)
+    # format이 수행하던 {{ }} 이스케이프 해제를 사전 적용
+    return [part.replace("{{", "{").replace("}}", "}") for part in parts]
+
+
+# 요약 프롬프트 템플릿을 임포트 시점에 한 번만 분해 (행당 format 파싱 제거)
+_SINGLE_PROMPT_PARTS = _compile_template(
+    SUMMARIZE_WEB_SEARCH, ["webpage_content", "date"]
+)
+_BATCH_PROMPT_PARTS = _compile_template(
+    SUMMARIZE_WEB_SEARCH_BATCH,
+    ["num_documents", "webpage_contents", "num_documents", "date"],
 )
 
 
@@ -66,13 +216,255 @@ class Summary(BaseModel):
     summary: str = Field(description="Key learnings from the webpage.")
 
 
-def summarize_webpage_contents(webpage_contents: list[str]) -> list[Summary]:
-    """Summarize multiple webpage contents in parallel using batch processing.
+class BatchSummary(BaseModel):
+    """Schema for row-marshaled summarization of multiple webpages in one prompt."""
 
-    LangChain의 batch() 메서드를 활용하여 여러 웹페이지 콘텐츠를 병렬로 요약
+    items: list[Summary] = Field(
+        description="One summary per document, in document order."
+    )
+
+
+# with_structured_output은 호출마다 도구 스키마를 감싼 Runnable을 새로 생성하므로
+# 모듈 레벨에서 한 번만 구성하여 재사용
+_STRUCTURED_SUMMARIZER = summarization_model.with_structured_output(Summary)
+_STRUCTURED_BATCH_SUMMARIZER = summarization_model.with_structured_output(BatchSummary)
+
+
+def _fallback_summary(index: int, content: str) -> Summary:
+    """Build a cheap truncation-based summary when LLM summarization fails.
+
+    Args:
+        index: Position of the content in the original list
+        content: Raw webpage content to truncate
+
+    Returns:
+        Summary object with a generic filename and truncated content
+    """
+    return Summary(
+        filename=f"search_result_{index}.md",
+        summary=(content[:1000] + "..." if len(content) > 1000 else content),
+    )
+
+
+def _clip_for_summary(content: str) -> str:
+    """Clip oversized content to a head+tail slice for summarization input.
+
+    Args:
+        content: Raw webpage content
+
+    Returns:
+        Content unchanged, or its head and tail halves joined by an elision
+        marker when it exceeds MAX_SUMMARY_INPUT
+    """
+    if len(content) <= MAX_SUMMARY_INPUT:
+        return content
+    half = MAX_SUMMARY_INPUT // 2
+    return (
+        content[:half]
+        + "\n\n[... middle of document elided for summarization ...]\n\n"
+        + content[-half:]
+    )
+
+
+def _chunk_contents(webpage_contents: list[str]) -> list[list[str]]:
+    """Split webpage contents into row-marshaling chunks of ROW_MARSHAL_BATCH.
+
+    Args:
+        webpage_contents: Raw webpage contents to group
+
+    Returns:
+        List of chunks, each holding up to ROW_MARSHAL_BATCH contents
+    """
+    return [
+        webpage_contents[i : i + ROW_MARSHAL_BATCH]
+        for i in range(0, len(webpage_contents), ROW_MARSHAL_BATCH)
+    ]
+
+
+def _restore_input_order(
+    ordered_summaries: list[Summary], order: list[int]
+) -> list[Summary]:
+    """Scatter length-sorted summaries back to their original input positions.
+
+    Args:
+        ordered_summaries: Summaries in length-sorted processing order
+        order: Original index of each processed content
+
+    Returns:
+        Summaries rearranged to match the caller's input order
+    """
+    restored: list[Summary | None] = [None] * len(ordered_summaries)
+    for position, summary in zip(order, ordered_summaries):
+        restored[position] = summary
+    return restored
+
+
+def _render_marshaled_prompt(chunk: list[str], date: str) -> str:
+    """Render one summarization prompt covering every webpage in a chunk.
+
+    여러 웹페이지를 번호가 매겨진 섹션으로 연결하여 하나의 프롬프트로 구성
+
+    Args:
+        chunk: Webpage contents to pack into a single prompt
+        date: Current date string for the prompt
+
+    Returns:
+        Fully-rendered multi-document summarization prompt
+    """
+    sections = "\n\n".join(
+        f"### Document {i}\n\n{content}" for i, content in enumerate(chunk, 1)
+    )
+    # 사전 분해된 템플릿 파트를 순수 문자열 연결로 조립
+    parts = _BATCH_PROMPT_PARTS
+    num_documents = str(len(chunk))
+    return (
+        parts[0]
+        + num_documents
+        + parts[1]
+        + sections
+        + parts[2]
+        + num_documents
+        + parts[3]
+        + date
+        + parts[4]
+    )
+
+
+def _parse_summary_array_json(text: str | None, expected: int) -> list[Summary]:
+    """Parse a JSON array of summaries from the model's response.
+
+    Args:
+        text: Raw model response text containing a JSON array, or None for
+            a batch entry that errored or expired
+        expected: Number of summaries the array must contain
+
+    Returns:
+        Parsed Summary objects in document order
+
+    Raises:
+        ValueError: If the entry failed, no JSON array is found, or the
+            count does not match
+    """
+    # 실패/만료된 Batch 항목(None)도 ValueError로 승격하여 행 단위 재시도 유도
+    if text is None:
+        raise ValueError("Batch entry returned no response text")
+    start = text.find("[")
+    end = text.rfind("]")
+    if start < 0 or end < start:
+        raise ValueError("No JSON array found in model response")
+    data = json.loads(text[start : end + 1])
+    if len(data) != expected:
+        raise ValueError(f"Expected {expected} summaries, got {len(data)}")
+    return [Summary(**item) for item in data]
+
+
+async def _summarize_rows_individually(
+    chunk: list[str], start_index: int
+) -> list[Summary]:
+    """Summarize a chunk one webpage per request after a marshaled-prompt failure.
+
+    마샬링된 청크의 JSON 파싱이 실패한 경우, 잘못된 한 행이 그룹 전체를
+    망치지 않도록 해당 청크만 행 단위 요약으로 재시도합니다.
+
+    Args:
+        chunk: Webpage contents from the failed chunk
+        start_index: Position of the chunk's first content in the original list
+
+    Returns:
+        List of Summary objects, one per content in the chunk
+    """
+    # 루프 불변인 현재 시각은 한 번만 계산 (strftime의 %A 요일 연산 포함)
+    # 사전 분해된 템플릿 파트를 순수 문자열 연결로 조립
+    now = get_current_time()
+    parts = _SINGLE_PROMPT_PARTS
+    batch_inputs = [
+        [HumanMessage(content=parts[0] + content + parts[1] + now + parts[2])]
+        for content in chunk
+    ]
+    try:
+        return await _STRUCTURED_SUMMARIZER.abatch(batch_inputs)
+    except Exception:
+        return [
+            _fallback_summary(start_index + i, content)
+            for i, content in enumerate(chunk)
+        ]
+
+
+def _summarize_via_message_batches(
+    prompts: list[str], doc_counts: list[int]
+) -> list[str | None]:
+    """Submit summarization prompts as one Anthropic Message Batches job.
+
+    모든 프롬프트를 단일 Batch 작업으로 제출하고 완료까지 폴링한 뒤,
+    custom_id 기준으로 원래 순서에 맞춰 응답 텍스트를 재정렬하여 반환합니다.
+    Batch API는 요청당 과금이 절반이며 분당 요청 수 제한을 우회합니다.
+
+    Args:
+        prompts: Fully-rendered summarization prompts, one per chunk
+        doc_counts: Number of marshaled documents in each prompt, used to
+            scale the output token budget so multi-document JSON arrays
+            are not truncated mid-response
+
+    Returns:
+        Model response texts in input order; None for failed entries
+
+    Raises:
+        TimeoutError: If the batch does not finish within BATCH_POLL_TIMEOUT;
+            the batch job is cancelled before raising
+    """
+    # 리스트 인덱스를 custom_id로 부여하여 순서 복원이 가능하도록 구성
+    batch = anthropic_client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": SUMMARIZATION_MODEL_NAME,
+                    "max_tokens": MAX_TOKENS_PER_DOCUMENT * doc_count,
+                    "temperature": 0.0,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for i, (prompt, doc_count) in enumerate(zip(prompts, doc_counts))
+        ]
+    )
+
+    # 처리 완료(ended)까지 마감 시간 내에서 폴링
+    deadline = time.monotonic() + BATCH_POLL_TIMEOUT
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            # 마감 초과시 작업을 취소하고 호출자가 실시간 경로로 폴백하도록 통지
+            anthropic_client.messages.batches.cancel(batch.id)
+            raise TimeoutError(
+                f"Message batch {batch.id} did not finish within "
+                f"{BATCH_POLL_TIMEOUT:.0f}s"
+            )
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = anthropic_client.messages.batches.retrieve(batch.id)
+
+    # 결과 스트리밍 후 custom_id 기준으로 입력 순서에 맞게 재배치
+    texts: list[str | None] = [None] * len(prompts)
+    for entry in anthropic_client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            texts[int(entry.custom_id)] = entry.result.message.content[0].text
+    return texts
+
+
+async def summarize_webpage_contents(
+    webpage_contents: list[str], use_batch_api: bool = True
+) -> list[Summary]:
+    """Summarize multiple webpage contents with row-marshaled prompts.
+
+    웹페이지를 ROW_MARSHAL_BATCH개씩 하나의 프롬프트로 묶어(row-marshaling)
+    요청 수를 약 1/K로 줄이고 시스템 프롬프트 토큰을 상각합니다.
+    묶인 프롬프트들은 Message Batches 작업 하나로 제출되어 요청당 비용을
+    절반으로 줄이고 분당 요청 수(RPM) 제한을 우회합니다. 대화형 실행처럼
+    지연 시간이 더 중요한 경우 use_batch_api=False로 LangChain abatch()
+    병렬 호출 방식을 사용할 수 있습니다.
 
     Args:
         webpage_contents: List of raw webpage contents to summarize
+        use_batch_api: Whether to use the provider-native Batch API (cheaper,
+            higher throughput) instead of parallel single requests (lower latency)
 
     Returns:
         List of Summary objects with filename and summary for each content
@@ -80,46 +472,98 @@ def summarize_webpage_contents(webpage_contents: list[str]) -> list[Summary]:
     if not webpage_contents:
         return []
 
-    # 구조화된 출력 모델 설정
-    structured_model = summarization_model.with_structured_output(Summary)
+    # 초대형 페이지는 head+tail만 남기고, 길이가 비슷한 콘텐츠끼리 청크가
+    # 구성되도록 길이순으로 정렬 - 짧은 문서가 긴 문서와 한 프롬프트에 묶여
+    # 완료를 기다리는 일이 없도록 함 (결과는 마지막에 원래 순서로 재배치)
+    clipped = [_clip_for_summary(content) for content in webpage_contents]
+    order = sorted(range(len(clipped)), key=lambda i: len(clipped[i]))
+    ordered_contents = [clipped[i] for i in order]
 
-    # 각 콘텐츠에 대한 메시지 리스트 생성 (batch 입력 형식)
-    batch_inputs = [
-        [
-            HumanMessage(
-                content=SUMMARIZE_WEB_SEARCH.format(
-                    webpage_content=content, date=get_current_time()
-                )
-            )
-        ]
-        for content in webpage_contents
-    ]
+    # 콘텐츠를 K개 단위 청크로 묶고 청크별 멀티 문서 프롬프트 렌더링
+    # (루프 불변인 현재 시각은 한 번만 계산)
+    chunks = _chunk_contents(ordered_contents)
+    now = get_current_time()
+    prompts = [_render_marshaled_prompt(chunk, now) for chunk in chunks]
 
     try:
-        # batch() 메서드로 병렬 처리 실행
-        summaries = structured_model.batch(batch_inputs)
-        return summaries
+        summaries: list[Summary] = []
+        start_index = 0
+
+        if use_batch_api:
+            # 폴링 대기가 이벤트 루프를 막지 않도록 별도 스레드에서 Batch 작업 실행
+            try:
+                texts = await asyncio.to_thread(
+                    _summarize_via_message_batches,
+                    prompts,
+                    [len(chunk) for chunk in chunks],
+                )
+            except TimeoutError as e:
+                # 마감 초과로 취소된 경우 아래의 실시간 abatch 경로로 폴백
+                print(f"{e}, falling back to abatch processing")
+                texts = None
+
+            if texts is not None:
+                for chunk, text in zip(chunks, texts):
+                    try:
+                        chunk_summaries = _parse_summary_array_json(text, len(chunk))
+                    except (TypeError, ValueError):
+                        # 파싱 실패한 청크만 행 단위 요약으로 재시도
+                        chunk_summaries = await _summarize_rows_individually(
+                            chunk, start_index
+                        )
+                    summaries.extend(chunk_summaries)
+                    start_index += len(chunk)
+                return _restore_input_order(summaries, order)
+
+        # 각 청크 프롬프트에 대한 메시지 리스트 생성 (batch 입력 형식)
+        batch_inputs = [[HumanMessage(content=prompt)] for prompt in prompts]
+
+        # 행 단위 재시도에 필요한 청크별 시작 인덱스 사전 계산
+        chunk_starts = [0]
+        for chunk in chunks:
+            chunk_starts.append(chunk_starts[-1] + len(chunk))
+
+        # 완료되는 순서대로 청크 결과를 스트리밍 수집 - 가장 느린 청크를
+        # 기다리는 동안 실패한 청크의 행 단위 재시도를 먼저 시작할 수 있음
+        chunk_results: list[list[Summary]] = [[] for _ in chunks]
+        async for index, result in _STRUCTURED_BATCH_SUMMARIZER.abatch_as_completed(
+            batch_inputs, return_exceptions=True
+        ):
+            chunk = chunks[index]
+            if isinstance(result, BatchSummary) and len(result.items) == len(chunk):
+                chunk_results[index] = result.items
+            else:
+                # 실패한 청크만 행 단위 요약으로 재시도
+                chunk_results[index] = await _summarize_rows_individually(
+                    chunk, chunk_starts[index]
+                )
+
+        # 길이순 평탄화 후 원래 입력 순서로 복원
+        for chunk_summaries in chunk_results:
+            summaries.extend(chunk_summaries)
+        return _restore_input_order(summaries, order)
 
     except Exception as e:
         # 실패시 기본 요약 객체 리스트 반환
         print(f"Batch processing failed: {e}, falling back to sequential processing")
         return [
-            Summary(
-                filename=f"search_result_{i}.md",
-                summary=(content[:1000] + "..." if len(content) > 1000 else content),
-            )
+            _fallback_summary(i, content)
             for i, content in enumerate(webpage_contents)
         ]
 
 
-def process_search_results(results: dict) -> list[dict]:
+async def process_search_results(
+    results: dict, use_batch_api: bool = True
+) -> list[dict]:
     """Process search results by summarizing content in parallel using batch processing.
 
-    LangChain의 batch() 메서드를 활용하여 여러 검색 결과를 병렬로 요약합니다.
+    여러 검색 결과를 비동기로 병렬 요약합니다.
     순차 처리 대비 처리 시간을 대폭 단축할 수 있습니다.
 
     Args:
         results: Tavily search results dictionary
+        use_batch_api: Whether summarization should use the provider-native
+            Batch API (cheaper) or parallel single requests (lower latency)
 
     Returns:
         List of processed results with summaries
@@ -129,11 +573,29 @@ def process_search_results(results: dict) -> list[dict]:
     if not search_results:
         return []
 
-    # 모든 raw_content를 리스트로 추출 (batch 입력용)
-    raw_contents = [result.get("raw_content", "") for result in search_results]
+    # 동일 콘텐츠 중복 제거 - 뉴스 신디케이션 등으로 같은 본문이 여러 결과에
+    # 반복될 때 고유 콘텐츠만 요약하여 LLM 토큰 비용을 중복률만큼 절감
+    seen: dict[str, int] = {}
+    unique_contents: list[str] = []
+    index_map: list[int] = []
+    for result in search_results:
+        # Tavily는 추출 실패한 페이지에 raw_content=null을 반환하므로 or로 방어
+        content = result.get("raw_content") or ""
+        digest = blake2b(content.encode(), digest_size=16).hexdigest()
+        unique_index = seen.get(digest)
+        if unique_index is None:
+            unique_index = len(unique_contents)
+            seen[digest] = unique_index
+            unique_contents.append(content)
+        index_map.append(unique_index)
+
+    # 고유 콘텐츠만 비동기 병렬 요약 처리 (summarize_webpage_contents 함수 활용)
+    unique_summaries = await summarize_webpage_contents(
+        unique_contents, use_batch_api=use_batch_api
+    )
 
-    # batch 방식으로 모든 콘텐츠를 병렬 요약 처리 (summarize_webpage_contents 함수 활용)
-    summary_objects = summarize_webpage_contents(raw_contents)
+    # 원본 인덱스로 요약 결과를 다시 매핑
+    summary_objects = [unique_summaries[i] for i in index_map]
 
     # 요약 결과와 원본 검색 결과를 결합하여 최종 결과 생성
     processed_results = []
@@ -151,8 +613,49 @@ def process_search_results(results: dict) -> list[dict]:
     return processed_results
 
 
+# 검색 결과 파일에 인라인 저장할 raw content 최대 크기 - 초과분은 절단
+# (대부분의 세션은 raw content를 다시 읽지 않으므로 state 병합/체크포인트마다
+# 수백 KB를 운반할 이유가 없음)
+MAX_INLINE_RAW = 64 * 1024
+
+
+def _cap_raw_content(raw_content: str) -> str:
+    """Cap raw webpage content stored inline in a search-result file.
+
+    Args:
+        raw_content: Raw content returned by the search API (may be empty)
+
+    Returns:
+        Content truncated to MAX_INLINE_RAW with an explicit marker, a
+        placeholder when empty, or the original content when within the cap
+    """
+    if not raw_content:
+        return "No raw content available"
+    if len(raw_content) <= MAX_INLINE_RAW:
+        return raw_content
+    truncated_chars = len(raw_content) - MAX_INLINE_RAW
+    return (
+        raw_content[:MAX_INLINE_RAW] + f"\n\n[truncated {truncated_chars} chars]"
+    )
+
+
+# 검색 결과 파일 본문 템플릿 (호출마다 f-string을 재구성하지 않도록 모듈 레벨 상수화)
+SEARCH_RESULT_TEMPLATE = """# Search Result: {title}
+
+**URL:** {url}
+**Query:** {query}
+**Date:** {date}
+
+## Summary
+{summary}
+
+## Raw Content
+{raw_content}
+"""
+
+
 @tool(parse_docstring=True)
-def tavily_search(
+async def tavily_search(
     query: str,
     state: Annotated[DeepAgentState, InjectedState],
     tool_call_id: Annotated[str, InjectedToolCallId],
@@ -160,6 +663,7 @@ def tavily_search(
     topic: Annotated[
         Literal["general", "news", "finance"], InjectedToolArg
     ] = "general",
+    use_batch_api: Annotated[bool, InjectedToolArg] = False,
 ) -> Command:
     """웹 검색을 수행하고 상세한 결과를 파일에 저장하면서 최소한의 컨텍스트만 반환합니다.
 
@@ -172,12 +676,14 @@ def tavily_search(
         tool_call_id: 주입된 도구 호출 식별자
         max_results: 반환할 최대 결과 수 (기본값: 1)
         topic: 토픽 필터 - 'general', 'news', 또는 'finance' (기본값: 'general')
+        use_batch_api: 요약에 비용 최적화된 Message Batches 경로 사용 여부 -
+            대화형 턴은 지연 시간이 우선이므로 기본값은 False
 
     Returns:
         전체 결과를 파일에 저장하고 최소한의 요약을 제공하는 Command
     """
-    # 검색 실행
-    search_results = run_web_search(
+    # 검색 실행 (비동기, 이벤트 루프 블로킹 없음)
+    search_results = await arun_web_search(
         query,
         max_results=max_results,
         topic=topic,
@@ -185,46 +691,52 @@ def tavily_search(
     )
 
     # 결과 처리 및 요약
-    processed_results = process_search_results(search_results)
+    processed_results = await process_search_results(
+        search_results, use_batch_api=use_batch_api
+    )
 
-    # 각 결과를 파일에 저장하고 요약 준비
-    files = state.get("files", {})
-    saved_files = []
-    summaries = []
+    # 새로 작성된 검색 결과 파일만 델타로 수집 (기존 files 딕셔너리는 변경하지 않음)
+    # 결과 수를 미리 알고 있으므로 saved_files를 사전 할당하고 단일 패스로 구성
+    new_files: dict[str, str] = {}
+    saved_files: list[str] = [""] * len(processed_results)
+    summary_parts: list[str] = []
+
+    # 루프 불변인 현재 시각은 한 번만 계산
+    now = get_current_time()
 
     for i, result in enumerate(processed_results):
         # 요약에서 AI가 생성한 파일명 사용
         filename = result["filename"]
 
-        # 전체 상세 정보를 포함한 파일 콘텐츠 생성
-        file_content = f"""# Search Result: {result['title']}
-
-**URL:** {result['url']}
-**Query:** {query}
-**Date:** {get_current_time()}
-
-## Summary
-{result['summary']}
-
-## Raw Content
-{result['raw_content'] if result['raw_content'] else 'No raw content available'}
-"""
-
-        files[filename] = file_content
-        saved_files.append(filename)
-        summaries.append(f"- {filename}: {result['summary']}...")
+        # 전체 상세 정보를 포함한 파일 콘텐츠 생성 (사전 파싱된 템플릿 사용)
+        # raw content가 큰 경우 압축 저장하여 state 병합/체크포인트 비용 절감
+        new_files[filename] = maybe_compress_content(
+            SEARCH_RESULT_TEMPLATE.format_map(
+                {
+                    "title": result["title"],
+                    "url": result["url"],
+                    "query": query,
+                    "date": now,
+                    "summary": result["summary"],
+                    "raw_content": _cap_raw_content(result["raw_content"]),
+                }
+            )
+        )
+        saved_files[i] = filename
+        summary_parts.append(f"- {filename}: {result['summary']}...")
 
     # 도구 메시지를 위한 최소한의 요약 생성 - 수집된 내용에 집중
+    summary_listing = "\n".join(summary_parts)
     summary_text = f"""🔍 Found {len(processed_results)} result(s) for '{query}':
 
-{chr(10).join(summaries)}
+{summary_listing}
 
 Files: {', '.join(saved_files)}
 💡 Use read_file() to access full details when needed."""
 
     return Command(
         update={
-            "files": files,
+            "files": new_files,
             "messages": [ToolMessage(summary_text, tool_call_id=tool_call_id)],
         }
     )
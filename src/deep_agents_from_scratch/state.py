@@ -6,10 +6,18 @@ This module defines the extended agent state structure that supports:
 - Efficient state merging with reducer functions
 """
 
+import json
 from typing import Annotated, Literal, NotRequired
 from typing_extensions import TypedDict
 from langchain.agents import AgentState
 
+# 대용량 가상 파일 시스템 스냅샷의 JSON 직렬화 가속을 위한 선택적 orjson 사용
+# (미설치 시 표준 라이브러리 json으로 동작)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 복잡한 작업 플로우의 진행 상황 추적을 위한 TODO 항목 구조 정의
 class Todo(TypedDict):
     """A structured task item for tracking progress through complex workflows.
@@ -27,21 +35,67 @@ def file_reducer(left, right):
     """Merge two file dictionaries, with right side taking precedence.
 
     Used as a reducer function for the files field in agent state,
-    allowing incremental updates to the virtual file system.
+    allowing incremental updates to the virtual file system. Tools emit
+    only a delta of new/changed files as the right side, so each merge
+    costs O(changed files) rather than re-merging a full snapshot.
 
     Args:
         left: Left side dictionary (existing files)
-        right: Right side dictionary (new/updated files)
+        right: Right side dictionary (delta of new/updated files)
 
     Returns:
         Merged dictionary with right values overriding left values
     """
     if left is None:
         return right
-    elif right is None:
+    if right is None or not right:
         return left
-    else:
-        return {**left, **right}
+
+    # 단일 파일 델타(write_file의 일반적인 경우) 전용 빠른 경로:
+    # 내용이 동일하면 기존 객체를 그대로 반환하여 다운스트림 무효화를 방지하고,
+    # 변경시에는 C 레벨 dict.copy() 후 한 항목만 갱신
+    if len(right) == 1:
+        key, value = next(iter(right.items()))
+        if key in left and left[key] == value:
+            return left
+        merged = left.copy()
+        merged[key] = value
+        return merged
+
+    return {**left, **right}
+
+# 체크포인터의 커스텀 serde 등에 연결할 수 있는 상태 스냅샷 직렬화 헬퍼
+def dump_state_snapshot(snapshot: dict) -> bytes:
+    """Serialize a JSON-compatible state snapshot (e.g. the files dict) to bytes.
+
+    Uses orjson when available, which is several times faster than the
+    stdlib encoder — the files dict carries the bulk bytes of agent state,
+    so checkpoint serialization is where that difference shows.
+
+    Args:
+        snapshot: JSON-compatible mapping such as the files or todos field
+
+    Returns:
+        Compact JSON bytes representation of the snapshot
+    """
+    if orjson is not None:
+        return orjson.dumps(snapshot)
+    return json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def load_state_snapshot(data: bytes) -> dict:
+    """Deserialize a state snapshot previously produced by dump_state_snapshot.
+
+    Args:
+        data: JSON bytes to decode
+
+    Returns:
+        Deserialized snapshot mapping
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # LangGraph AgentState 상속, TODO 리스트와 가상 파일 시스템 포함한 확장 state 구조 정의
 class DeepAgentState(AgentState):
@@ -5,7 +5,7 @@ with isolated contexts. Sub-agents prevent context clash by operating with clean
 context windows containing only their specific task description.
 """
 
-from typing import Annotated, NotRequired
+from typing import Annotated, Any, NotRequired
 
 from langchain.agents import create_agent
 from langchain_core.messages import HumanMessage, ToolMessage
@@ -27,6 +27,37 @@ class SubAgent(TypedDict):
     tools: NotRequired[list[str]]
 
 
+# 동일 구성으로 task 도구를 재생성할 때(노트북 재실행 등) 도구 래핑과
+# create_agent 그래프 컴파일을 반복하지 않기 위한 프로세스 로컬 캐시.
+# 키에 id()를 사용하므로 참조가 유지되는 동일 객체에 한해 재사용됨.
+_TOOLS_MAP_CACHE: dict[tuple, dict[str, BaseTool]] = {}
+_AGENT_CACHE: dict[tuple, Any] = {}
+
+
+def _get_tools_by_name(tools) -> dict[str, BaseTool]:
+    """Build (or reuse) the name-to-tool mapping for a tools list.
+
+    비-BaseTool 콜러블은 tool()로 래핑하며, 동일한 도구 리스트에 대해서는
+    캐시된 매핑을 재사용합니다.
+
+    Args:
+        tools: List of tools or plain callables to map by name
+
+    Returns:
+        Dictionary mapping tool names to BaseTool instances
+    """
+    cache_key = tuple(id(tool_) for tool_ in tools)
+    tools_by_name = _TOOLS_MAP_CACHE.get(cache_key)
+    if tools_by_name is None:
+        tools_by_name = {}
+        for tool_ in tools:
+            if not isinstance(tool_, BaseTool):
+                tool_ = tool(tool_)
+            tools_by_name[tool_.name] = tool_
+        _TOOLS_MAP_CACHE[cache_key] = tools_by_name
+    return tools_by_name
+
+
 def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     """Create a task delegation tool that enables context isolation through sub-agents.
 
@@ -45,12 +76,8 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     # Sub-agent 레지스트리 딕셔너리 생성, 이름을 키로 하여 에이전트 인스턴스 저장
     agents = {}
 
-    # 도구 이름별 매핑 딕셔너리 생성, Sub-agent별 도구 할당에 활용
-    tools_by_name = {}
-    for tool_ in tools:
-        if not isinstance(tool_, BaseTool):
-            tool_ = tool(tool_)
-        tools_by_name[tool_.name] = tool_
+    # 도구 이름별 매핑 딕셔너리 생성(캐시 재사용), Sub-agent별 도구 할당에 활용
+    tools_by_name = _get_tools_by_name(tools)
 
     # Sub-agent 구성 정보 기반으로 특화 에이전트 생성 및 레지스트리에 등록
     for _agent in subagents:
@@ -59,13 +86,26 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
             _tools = [tools_by_name[t] for t in _agent["tools"]]
         else:
             # 도구 미지정 시 전체 도구 할당
-            _tools = tools
-        agents[_agent["name"]] = create_agent(  # updated 1.0
-            model,
-            system_prompt=_agent["prompt"],
-            tools=_tools,
-            state_schema=state_schema,
+            _tools = list(tools_by_name.values())
+
+        # 동일 (모델, 프롬프트, 도구, 스키마) 구성의 컴파일된 그래프 재사용
+        # 컴파일된 그래프는 상태를 갖지 않으므로 재사용해도 안전함
+        agent_key = (
+            id(model),
+            _agent["prompt"],
+            tuple(sorted(t.name for t in _tools)),
+            id(state_schema),
         )
+        cached_agent = _AGENT_CACHE.get(agent_key)
+        if cached_agent is None:
+            cached_agent = create_agent(  # updated 1.0
+                model,
+                system_prompt=_agent["prompt"],
+                tools=_tools,
+                state_schema=state_schema,
+            )
+            _AGENT_CACHE[agent_key] = cached_agent
+        agents[_agent["name"]] = cached_agent
 
     # 사용 가능한 Sub-agent 목록을 도구 설명에 활용하기 위한 문자열 리스트 생성
     other_agents_string = [
@@ -73,7 +113,7 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
     ]
 
     @tool(description=TASK_DESCRIPTION_PREFIX.format(other_agents=other_agents_string))
-    def task(
+    async def task(
         description: str,
         subagent_type: str,
         state: Annotated[DeepAgentState, InjectedState],
@@ -93,19 +133,33 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
 
         # 작업 설명만 포함된 격리된 컨텍스트 생성, 부모 에이전트의 히스토리 미포함
         # HumanMessage 객체 사용 (일반 dict는 LangChain 메시지 검증 실패)
+        # 파일/TODO는 복사 없이 그대로 전달 — 도구들이 상태 딕셔너리를 직접
+        # 변경하지 않고 델타만 반환하므로 동일 객체 공유가 안전함
+        parent_files = state.get("files", {})
         new_state = {
             "messages": [HumanMessage(content=description)],
-            "files": state.get("files", {}),
+            "files": parent_files,
             "todos": state.get("todos", []),
         }
 
         # 격리된 환경에서 Sub-agent 실행 및 결과 획득
-        result = sub_agent.invoke(new_state)
+        # (비동기 실행이므로 tavily_search 같은 코루틴 전용 도구도 구동 가능)
+        result = await sub_agent.ainvoke(new_state)
+
+        # 부모에 없거나 내용이 달라진 파일만 델타로 추출하여 reducer 병합 비용을
+        # O(전체 파일)에서 O(새 파일)로 축소 (동일 객체는 is 비교로 즉시 제외)
+        result_files = result.get("files", {})
+        files_delta = {}
+        if result_files is not parent_files:
+            for filename, content in result_files.items():
+                existing = parent_files.get(filename)
+                if existing is not content and existing != content:
+                    files_delta[filename] = content
 
         # 작업 결과를 Command 객체로 래핑하여 부모 에이전트에 ToolMessage 형태로 반환
         return Command(
             update={
-                "files": result.get("files", {}),  # 파일 변경 사항 병합
+                "files": files_delta,  # 새로 생성/변경된 파일만 병합
                 "messages": [
                     # Sub-agent의 마지막 메시지를 ToolMessage로 변환하여 반환
                     ToolMessage(
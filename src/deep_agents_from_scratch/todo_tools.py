@@ -17,6 +17,9 @@ from langgraph.types import Command
 from deep_agents_from_scratch.prompts import WRITE_TODOS_DESCRIPTION
 from deep_agents_from_scratch.state import DeepAgentState, Todo
 
+# TODO 상태별 표시 이모지 (호출마다 딕셔너리를 재생성하지 않도록 모듈 레벨 상수화)
+_STATUS_EMOJI = {"pending": "⏳", "in_progress": "🔄", "completed": "✅"}
+
 
 # write_todos 툴 정의, LLM이 전달한 TODO 리스트를 state에 저장 및 메시지 기록
 @tool(description=WRITE_TODOS_DESCRIPTION,parse_docstring=True)
@@ -68,12 +71,17 @@ def read_todos(
         message_content = "No todos currently in the list."
     else:
         # 현재 TODO 리스트를 번호, 이모지, 상태와 함께 포맷팅하여 문자열로 생성
-        result = "Current TODO List:\n"
-        for i, todo in enumerate(todos, 1):
-            status_emoji = {"pending": "⏳", "in_progress": "🔄", "completed": "✅"}
-            emoji = status_emoji.get(todo["status"], "❓")
-            result += f"{i}. {emoji} {todo['content']} ({todo['status']})\n"
-        message_content = result.strip()
+        # (반복 문자열 += 누적 대신 제너레이터 기반 join으로 선형 시간 구성)
+        message_content = "\n".join(
+            (
+                "Current TODO List:",
+                *(
+                    f"{i}. {_STATUS_EMOJI.get(todo['status'], '❓')} "
+                    f"{todo['content']} ({todo['status']})"
+                    for i, todo in enumerate(todos, 1)
+                ),
+            )
+        )
 
     # Command 객체로 래핑하여 ToolMessage와 함께 반환
     return Command(